@@ -4,40 +4,94 @@ ALX Community Feedback Survey Data Processor
 Processes CSV survey data and creates categorized analysis for interactive HTML report.
 """
 
+import numpy as np
 import pandas as pd
 import json
 import re
 import difflib
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
 import unicodedata
-from datetime import datetime
-from collections import Counter, defaultdict
-from typing import Dict, List, Any
-
-def clean_text(text):
-    """Clean and normalize text responses."""
-    if pd.isna(text) or text == '':
-        return ""
-    return str(text).strip()
-
-def _normalize_location_string(raw: Any) -> str:
-    """Normalize a free-text location to a simplified ASCII-ish lowercase string."""
-    if pd.isna(raw) or raw == '':
-        return ''
-    text = str(raw).strip()
+from collections import defaultdict
+from typing import Dict, List, Any, Tuple
+
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+except ImportError:  # optional accelerator; difflib alone gives the same answers
+    rf_process = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; keyword and term scans fall back to compiled regexes
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; output is written with the stdlib encoder
+    orjson = None
+
+def _compile_terms(terms: List[str]):
+    """Compile terms for _find_terms / _count_terms.
+
+    The alternation lists longer terms first, so a match is the longest term
+    starting at that position; any shorter term starting there is a prefix of
+    it, so each term also carries the set of terms it implies. With pyahocorasick
+    installed, an automaton reporting every (overlapping) occurrence is used instead.
+    """
+    ordered = sorted(terms, key=len, reverse=True)
+    pattern = re.compile('|'.join(re.escape(term) for term in ordered))
+    implied = {term: frozenset(t for t in ordered if term.startswith(t)) for term in ordered}
+    automaton = None
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for term in ordered:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+    return pattern, implied, automaton
+
+def _find_terms(compiled, text: str) -> set:
+    """Return the distinct terms that occur in text as substrings."""
+    pattern, implied, automaton = compiled
+    if automaton is not None:
+        return {term for _, term in automaton.iter(text)}
+    found = set()
+    # Restart one character past each match start so overlapping terms are seen
+    match = pattern.search(text)
+    while match:
+        found |= implied[match.group()]
+        match = pattern.search(text, match.start() + 1)
+    return found
+
+def _count_terms(compiled, text: str) -> int:
+    """Count how many distinct terms occur in text as substrings."""
+    return len(_find_terms(compiled, text))
+
+# Precompiled pieces of the location normalization pipeline
+_QUOTES_TRANS = str.maketrans({'’': "'", '‘': "'", '“': '"', '”': '"'})
+_WS_RE = re.compile(r"\s+")
+_ALLOW_RE = re.compile(r"[^a-z\s,'\-]")
+
+@functools.lru_cache(maxsize=16384)
+def _normalize_location_cached(text: str) -> str:
+    """Normalize a free-text location to a simplified ASCII-ish lowercase string.
+
+    Cached, since location answers repeat heavily.
+    """
     # Replace unusual apostrophes/quotes with ASCII
-    text = text.replace('’', "'").replace('‘', "'").replace('“', '"').replace('”', '"')
-    # Collapse consecutive whitespace
-    text = re.sub(r"\s+", ' ', text)
-    # Lowercase
-    text = text.lower()
+    text = text.strip().translate(_QUOTES_TRANS)
+    # Collapse consecutive whitespace, then lowercase
+    text = _WS_RE.sub(' ', text).lower()
     # Strip emoji and symbols by allowing letters, spaces, commas, apostrophes, hyphens
-    text = re.sub(r"[^a-z\s,'\-]", '', text)
-    # Normalize accents for matching (we will restore canonical country names later)
-    text = unicodedata.normalize('NFKD', text)
-    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    text = _ALLOW_RE.sub('', text)
+    # Normalize accents for matching (we will restore canonical country names later);
+    # only ASCII remains after the filter above, so dropping non-ASCII removes combining marks
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
     # Collapse spaces again after removals
-    text = re.sub(r"\s+", ' ', text).strip()
-    return text
+    return _WS_RE.sub(' ', text).strip()
 
 KNOWN_COUNTRIES = [
     'Algeria','Angola','Benin','Botswana','Burkina Faso','Burundi','Cabo Verde','Cameroon','Central African Republic',
@@ -128,7 +182,49 @@ NON_COUNTRY_BLACKLIST_EXACT = {
 NON_COUNTRY_BLACKLIST_SUBSTR = {
     'gmail', 'yahoo', 'outlook', 'hotmail', 'mail', 'gmailcom', 'yahoocom', 'email', 'com', 'http', 'https'
 }
+# Substrings that veto the title-cased fallback for otherwise unmatched answers
+NON_COUNTRY_FALLBACK_SUBSTR = {
+    '@', 'job', 'career', 'skill', 'network', 'opportunity', 'thanks', 'gmail', 'mail'
+}
+
+# Each substring blacklist as one alternation (sorted only to keep the pattern stable)
+_BLACKLIST_RE = re.compile('|'.join(re.escape(bad) for bad in sorted(NON_COUNTRY_BLACKLIST_SUBSTR)))
+_FALLBACK_BLACKLIST_RE = re.compile('|'.join(re.escape(bad) for bad in sorted(NON_COUNTRY_FALLBACK_SUBSTR)))
+
+# Known countries longest first (stable), so 'South Sudan' outranks 'Sudan'
+_KNOWN_COUNTRIES_BY_LEN_DESC = sorted(KNOWN_COUNTRIES, key=len, reverse=True)
 
+# All known countries as one word-bounded alternation, longest names first. The
+# lookahead reports a match at every position so overlapping names are all seen,
+# and the rank picks the same country the longest-first scan would.
+_COUNTRY_RANK = {c.lower(): i for i, c in enumerate(_KNOWN_COUNTRIES_BY_LEN_DESC)}
+_COUNTRY_LOWER_TO_CANON = {c.lower(): c for c in KNOWN_COUNTRIES}
+_KNOWN_COUNTRIES_LOWER = list(_COUNTRY_LOWER_TO_CANON)
+_COUNTRY_ALT_RE = re.compile(r"(?=\b(" + "|".join(re.escape(c) for c in _COUNTRY_RANK) + r")\b)")
+# 'Nigeria' must win over its substring 'Niger', so it is checked before the alternation
+_NIGERIA_RE = re.compile(r"\bnigeria\b")
+
+# City keys for the substring fallback; the earliest-declared key present wins
+_CITY_TERMS = _compile_terms(list(CITY_TO_COUNTRY))
+_CITY_RANK = {city: i for i, city in enumerate(CITY_TO_COUNTRY)}
+
+def _fuzzy_country_match(text: str) -> str:
+    """Return the closest KNOWN_COUNTRIES entry by difflib ratio (cutoff 0.8), or ''.
+
+    ``text`` is already lowercased, so it is compared against lowercase names and
+    mapped back to the canonical spelling.
+    """
+    choices = _KNOWN_COUNTRIES_LOWER
+    if rf_process is not None:
+        # rapidfuzz's Indel ratio is never below difflib's ratio, so this only drops
+        # choices difflib would reject; difflib then picks among the survivors as before
+        choices = [c for c, _, _ in rf_process.extract(text, _KNOWN_COUNTRIES_LOWER, scorer=rf_fuzz.ratio, score_cutoff=79, limit=None)]
+        if not choices:
+            return ''
+    candidates = difflib.get_close_matches(text, choices, n=1, cutoff=0.8)
+    return _COUNTRY_LOWER_TO_CANON[candidates[0]] if candidates else ''
+
+@functools.lru_cache(maxsize=16384)
 def _best_country_match(text_normalized: str) -> str:
     """Try to match a normalized string to a canonical country using heuristics and fuzzy matching."""
     if not text_normalized:
@@ -140,6 +236,11 @@ def _best_country_match(text_normalized: str) -> str:
         if len(parts) >= 2:
             text_normalized = parts[-1]
 
+    # Exact country names are the common case; no city or alias key collides with one
+    canonical = _COUNTRY_LOWER_TO_CANON.get(text_normalized)
+    if canonical:
+        return canonical
+
     # Direct city mapping
     if text_normalized in CITY_TO_COUNTRY:
         return CITY_TO_COUNTRY[text_normalized]
@@ -149,24 +250,23 @@ def _best_country_match(text_normalized: str) -> str:
         return CANONICAL_NAME_FIXES[text_normalized]
 
     # Special-case common shadowing: ensure 'Nigeria' wins over 'Niger'
-    if re.search(r"\bnigeria\b", text_normalized):
+    if _NIGERIA_RE.search(text_normalized):
         return 'Nigeria'
 
     # Direct includes of country names using word boundaries, prefer longer country names first
-    for country in sorted(KNOWN_COUNTRIES, key=lambda c: -len(c)):
-        pattern = r"\b" + re.escape(country.lower()) + r"\b"
-        if re.search(pattern, text_normalized):
-            return country
+    found = _COUNTRY_ALT_RE.findall(text_normalized)
+    if found:
+        return _COUNTRY_LOWER_TO_CANON[min(found, key=_COUNTRY_RANK.__getitem__)]
 
     # Try fuzzy matching to country list (threshold tuned for short typos like "Keny", "Nig")
-    candidates = difflib.get_close_matches(text_normalized.title(), KNOWN_COUNTRIES, n=1, cutoff=0.8)
-    if candidates:
-        return candidates[0]
+    fuzzy = _fuzzy_country_match(text_normalized)
+    if fuzzy:
+        return fuzzy
 
     # If the text equals a known city term (not exact key), try contains-based city mapping
-    for city_key, mapped_country in CITY_TO_COUNTRY.items():
-        if city_key in text_normalized:
-            return mapped_country
+    cities = _find_terms(_CITY_TERMS, text_normalized)
+    if cities:
+        return CITY_TO_COUNTRY[min(cities, key=_CITY_RANK.__getitem__)]
 
     return ''
 
@@ -174,14 +274,17 @@ def clean_country_name(country):
     """Clean and normalize country names, handling city-country combinations and common typos."""
     if pd.isna(country) or country == '':
         return ''
+    return _clean_country_cached(_normalize_location_cached(str(country)))
 
-    normalized = _normalize_location_string(country)
+@functools.lru_cache(maxsize=16384)
+def _clean_country_cached(normalized: str) -> str:
+    """Map an already-normalized location string to a country name."""
     if not normalized:
         return ''
 
     if normalized in NON_COUNTRY_BLACKLIST_EXACT:
         return ''
-    if any(bad in normalized for bad in NON_COUNTRY_BLACKLIST_SUBSTR):
+    if _BLACKLIST_RE.search(normalized):
         return ''
 
     best = _best_country_match(normalized)
@@ -193,53 +296,104 @@ def clean_country_name(country):
     if 1 <= len(tokens) <= 3 and len(normalized) <= 30:
         fallback = ' '.join(tokens).title()
         # Guard against obvious non-countries like email fragments or generic words
-        if not any(bad in normalized for bad in ['@', 'job', 'career', 'skill', 'network', 'opportunity', 'thanks', 'gmail', 'mail']):
+        if not _FALLBACK_BLACKLIST_RE.search(normalized):
             return fallback
     return ''
 
-def _parse_timestamp(ts_val: Any) -> datetime:
-    if pd.isna(ts_val):
-        return datetime.min
-    s = str(ts_val).strip()
-    # Try multiple common formats
-    for fmt in ("%m/%d/%Y %H:%M:%S", "%m/%d/%Y %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-        try:
-            return datetime.strptime(s, fmt)
-        except Exception:
-            continue
-    # Fallback: pandas to_datetime
-    try:
-        return pd.to_datetime(s, errors='coerce') or datetime.min
-    except Exception:
-        return datetime.min
+def _normalize_location_series(locations: pd.Series) -> pd.Series:
+    """Column-wise _normalize_location_cached using the pandas .str accessor."""
+    # Object dtype keeps Python re semantics (Unicode-aware \s) on Arrow-backed pandas
+    text = locations.fillna('').astype(str).astype(object).str.strip().str.translate(_QUOTES_TRANS)
+    text = text.str.replace(_WS_RE, ' ', regex=True).str.lower()
+    text = text.str.replace(_ALLOW_RE, '', regex=True)
+    # Only ASCII survives the filter above, so dropping non-ASCII after NFKD removes the combining marks
+    non_ascii = ~text.map(str.isascii).astype(bool)
+    if non_ascii.any():
+        text[non_ascii] = text[non_ascii].str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii')
+    return text.str.replace(_WS_RE, ' ', regex=True).str.strip()
+
+def clean_country_series(locations: pd.Series) -> pd.Series:
+    """Vectorized clean_country_name over a whole location column."""
+    # Survey answers repeat heavily, so clean each distinct value once and broadcast
+    unique = pd.Series(locations.dropna().unique())
+    mapping = dict(zip(unique, _normalize_location_series(unique).map(_clean_country_cached)))
+    return locations.map(mapping).fillna('')
+
+# Timestamp layouts seen in Google Forms exports, tried in order before pandas' mixed parser
+_TIMESTAMP_FORMATS = ("%m/%d/%Y %H:%M:%S", "%m/%d/%Y %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M")
+
+def _parse_timestamps(values: pd.Series) -> pd.Series:
+    """Parse a timestamp column.
+
+    Missing values become Timestamp.min, so any real timestamp beats them;
+    unparseable values stay NaT and rank below even missing ones.
+    """
+    text = values.astype(str).str.strip()
+    parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    for fmt in _TIMESTAMP_FORMATS:
+        missing = parsed.isna() & values.notna()
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(text[missing], format=fmt, errors='coerce')
+    missing = parsed.isna() & values.notna()
+    if missing.any():
+        parsed[missing] = pd.to_datetime(text[missing], format='mixed', errors='coerce')
+    parsed[values.isna()] = pd.Timestamp.min
+    return parsed
 
 def deduplicate_by_email(df: pd.DataFrame) -> pd.DataFrame:
     """Deduplicate responses by email, keeping the latest Timestamp per email (case-insensitive)."""
-    email_cols = [col for col in df.columns if 'email' in col.lower()]
-    ts_cols = [col for col in df.columns if 'timestamp' in col.lower()]
-    if not email_cols or not ts_cols:
+    email_col = next((col for col in df.columns if 'email' in col.lower()), None)
+    ts_col = next((col for col in df.columns if 'timestamp' in col.lower()), None)
+    if email_col is None or ts_col is None:
         return df
 
-    email_col = email_cols[0]
-    ts_col = ts_cols[0]
-
-    df['_email_norm'] = df[email_col].astype(str).str.strip().str.lower()
-    df['_ts_parsed'] = df[ts_col].apply(_parse_timestamp)
+    # Sort and dedupe a two-column key frame indexed by row position instead of the whole survey
+    keys = pd.DataFrame({
+        'email': df[email_col].astype(str).str.strip().str.lower().fillna('').to_numpy(),
+        'ts': _parse_timestamps(df[ts_col]).to_numpy(),
+    })
+    has_email = (keys['email'] != '').to_numpy()
+    if not has_email.any():
+        return df
 
-    # Separate rows with valid emails and the rest
-    with_email = df[df['_email_norm'].fillna('') != '']
-    without_email = df[df['_email_norm'].fillna('') == '']
+    # Latest row per email: a stable descending sort keeps the first of tied rows (as
+    # idxmax did), NaT rows go last as idxmax skipped them, and re-sorting by email
+    # restores groupby's key order
+    latest = (keys[has_email].sort_values('ts', ascending=False, kind='mergesort', na_position='last')
+              .drop_duplicates('email', keep='first')
+              .sort_values('email', kind='mergesort'))
+
+    return pd.concat([df.iloc[latest.index], df[~has_email]], ignore_index=True)
+
+# Sentiment vocabularies; every term counts at most once per response
+POSITIVE_WORDS = [
+    'love', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'awesome', 'good', 'nice',
+    'helpful', 'useful', 'valuable', 'appreciate', 'thank', 'grateful', 'enjoy', 'happy',
+    'satisfied', 'perfect', 'outstanding', 'impressive', 'beneficial', 'effective', 'successful',
+    'easy', 'smooth', 'clear', 'convenient', 'accessible', 'friendly', 'supportive', 'inspiring'
+]
 
-    if with_email.empty:
-        df = df.drop(columns=['_email_norm', '_ts_parsed'], errors='ignore')
-        return df
+NEGATIVE_WORDS = [
+    'hate', 'terrible', 'awful', 'horrible', 'bad', 'poor', 'disappointing', 'frustrated',
+    'annoying', 'difficult', 'hard', 'confusing', 'slow', 'lag', 'laggy', 'broken', 'issue', 'problem',
+    'bug', 'error', 'fail', 'failure', 'crash', 'crashing', 'freeze', 'freezes', 'freezing', 'stuck',
+    'impossible', 'useless', 'waste', 'boring', 'unhappy', 'dissatisfied', 'concerned', 'worry', 'unfortunately', 'sadly',
+    'unresponsive'
+]
 
-    idx = with_email.groupby('_email_norm')['_ts_parsed'].idxmax()
-    deduped = with_email.loc[idx]
+# Negation or problem phrase patterns that indicate negative sentiment
+NEGATIVE_PATTERNS = [
+    'not good', 'not great', 'not helpful', 'not useful', 'no value', 'no good',
+    "don't like", 'do not like', "doesn't work", "doesnt work", "can't", 'cant ', 'cannot ',
+    'hard to', 'difficult to', 'too slow', 'very slow', 'so slow', 'keeps crashing', 'keeps crushing'
+]
 
-    result = pd.concat([deduped, without_email], ignore_index=True)
-    result = result.drop(columns=['_email_norm', '_ts_parsed'], errors='ignore')
-    return result
+_POSITIVE_TERMS = _compile_terms(POSITIVE_WORDS)
+_NEGATIVE_TERMS = _compile_terms(NEGATIVE_WORDS)
+_NEGATIVE_PATTERN_TERMS = _compile_terms(NEGATIVE_PATTERNS)
+# Texts shorter than every sentiment term cannot contain one
+_SENTIMENT_MIN_LEN = min(len(term) for term in (*POSITIVE_WORDS, *NEGATIVE_WORDS, *NEGATIVE_PATTERNS))
 
 def analyze_sentiment(text):
     """
@@ -248,43 +402,16 @@ def analyze_sentiment(text):
     """
     if not text:
         return 'neutral'
-    
-    text_lower = str(text).lower()
-    
-    # Positive indicators
-    positive_words = [
-        'love', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'awesome', 'good', 'nice', 
-        'helpful', 'useful', 'valuable', 'appreciate', 'thank', 'grateful', 'enjoy', 'happy', 
-        'satisfied', 'perfect', 'outstanding', 'impressive', 'beneficial', 'effective', 'successful',
-        'easy', 'smooth', 'clear', 'convenient', 'accessible', 'friendly', 'supportive', 'inspiring'
-    ]
-    
-    # Negative indicators
-    negative_words = [
-        'hate', 'terrible', 'awful', 'horrible', 'bad', 'poor', 'disappointing', 'frustrated', 
-        'annoying', 'difficult', 'hard', 'confusing', 'slow', 'lag', 'laggy', 'broken', 'issue', 'problem',
-        'bug', 'error', 'fail', 'failure', 'crash', 'crashing', 'freeze', 'freezes', 'freezing', 'stuck',
-        'impossible', 'useless', 'waste', 'boring', 'unhappy', 'dissatisfied', 'concerned', 'worry', 'unfortunately', 'sadly',
-        'unresponsive'
-    ]
-    
-    # Improvement/request words (usually neutral to positive)
-    improvement_words = [
-        'improve', 'better', 'enhance', 'upgrade', 'suggest', 'recommend', 'would like', 'hope',
-        'wish', 'could', 'should', 'need', 'want', 'feature', 'add', 'include', 'provide'
-    ]
-    
-    # Negation or problem phrase patterns that indicate negative sentiment
-    negative_patterns = [
-        'not good', 'not great', 'not helpful', 'not useful', 'no value', 'no good',
-        "don't like", 'do not like', "doesn't work", "doesnt work", "can't", 'cant ', 'cannot ',
-        'hard to', 'difficult to', 'too slow', 'very slow', 'so slow', 'keeps crashing', 'keeps crushing'
-    ]
-
-    positive_count = sum(1 for word in positive_words if word in text_lower)
-    negative_count = sum(1 for word in negative_words if word in text_lower)
-    improvement_count = sum(1 for word in improvement_words if word in text_lower)
-    negative_count += sum(1 for pat in negative_patterns if pat in text_lower)
+    return _lowered_sentiment(str(text).lower())
+
+@functools.lru_cache(maxsize=None)
+def _lowered_sentiment(text_lower: str) -> str:
+    """analyze_sentiment for text that is already lowercased."""
+    if len(text_lower) < _SENTIMENT_MIN_LEN:
+        return 'neutral'
+    positive_count = _count_terms(_POSITIVE_TERMS, text_lower)
+    negative_count = _count_terms(_NEGATIVE_TERMS, text_lower)
+    negative_count += _count_terms(_NEGATIVE_PATTERN_TERMS, text_lower)
 
     # Mixed signal handling
     if negative_count > 0 and positive_count > 0:
@@ -298,281 +425,291 @@ def analyze_sentiment(text):
         return 'negative'
     if positive_count > 0:
         return 'positive'
-    if improvement_count > 0:
-        return 'neutral'
+    # Requests and suggestions ('improve', 'would like', ...) are neutral, like any other text
     return 'neutral'
 
-def categorize_community_goals(responses):
-    """Categorize responses about what members hope to gain."""
-    categories = {
-        'Career Development & Job Opportunities': [],
-        'Networking & Community Building': [],
-        'Skill Development & Learning': [],
-        'Business & Entrepreneurship': [],
-        'Mentorship & Guidance': [],
-        'Other': []
-    }
-    
-    career_keywords = ['job', 'career', 'opportunity', 'employment', 'professional development', 'interview', 'resume', 'hire', 'position']
-    network_keywords = ['network', 'connect', 'community', 'friendship', 'relationship', 'collaborate', 'partnership']
-    skill_keywords = ['skill', 'learn', 'knowledge', 'education', 'training', 'course', 'expertise', 'development', 'upskill']
-    business_keywords = ['business', 'startup', 'entrepreneur', 'fund', 'investment', 'scale', 'venture', 'cofounder']
-    mentor_keywords = ['mentor', 'guidance', 'advice', 'support', 'help', 'coaching']
-    
-    for response in responses:
-        response_clean = clean_text(response).lower()
-        if not response_clean:
-            continue
-        
-        # Add sentiment analysis
-        sentiment = analyze_sentiment(response)
-        response_with_sentiment = {'text': response, 'sentiment': sentiment}
-            
-        categorized = False
-        
-        if any(keyword in response_clean for keyword in career_keywords):
-            categories['Career Development & Job Opportunities'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in network_keywords):
-            categories['Networking & Community Building'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in skill_keywords):
-            categories['Skill Development & Learning'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in business_keywords):
-            categories['Business & Entrepreneurship'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in mentor_keywords):
-            categories['Mentorship & Guidance'].append(response_with_sentiment)
-            categorized = True
-            
-        if not categorized:
-            categories['Other'].append(response_with_sentiment)
-    
-    return categories
-
-def categorize_circle_feedback(responses):
-    """Categorize Circle platform feedback."""
-    categories = {
-        'Positive User Experience': [],
-        'Performance Issues': [],
-        'Content Organization': [],
-        'Navigation & Usability': [],
-        'Feature Requests': [],
-        'Other': []
-    }
-    
-    positive_keywords = ['love', 'great', 'good', 'easy', 'nice', 'excellent', 'wonderful', 'amazing', 'helpful', 'useful']
-    performance_keywords = ['slow', 'load', 'lag', 'freeze', 'crash', 'speed', 'fast', 'performance']
-    content_keywords = ['content', 'post', 'organize', 'structure', 'format', 'layout']
-    navigation_keywords = ['navigate', 'find', 'search', 'menu', 'interface', 'design', 'user experience']
-    feature_keywords = ['feature', 'add', 'need', 'want', 'suggest', 'improve', 'enhancement']
-    
-    for response in responses:
-        response_clean = clean_text(response).lower()
-        if not response_clean:
-            continue
-        
-        # Add sentiment analysis
-        sentiment = analyze_sentiment(response)
-        response_with_sentiment = {'text': response, 'sentiment': sentiment}
-            
-        categorized = False
-        
-        if any(keyword in response_clean for keyword in positive_keywords):
-            categories['Positive User Experience'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in performance_keywords):
-            categories['Performance Issues'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in content_keywords):
-            categories['Content Organization'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in navigation_keywords):
-            categories['Navigation & Usability'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in feature_keywords):
-            categories['Feature Requests'].append(response_with_sentiment)
-            categorized = True
-            
-        if not categorized:
-            categories['Other'].append(response_with_sentiment)
-    
-    return categories
-
-def categorize_content_preferences(responses):
-    """Categorize what kind of content members want."""
-    categories = {
-        'Career Tips & Opportunities': [],
-        'Technical Skills & AI Content': [],
-        'Industry Trends & Leadership': [],
-        'Personal Development': [],
-        'Educational Resources': [],
-        'Other': []
-    }
-    
-    career_keywords = ['career', 'job', 'opportunity', 'interview', 'resume', 'professional']
-    tech_keywords = ['ai', 'tech', 'coding', 'programming', 'development', 'software', 'web3', 'data', 'analytics']
-    trends_keywords = ['trend', 'industry', 'leader', 'leadership', 'business', 'innovation']
-    personal_keywords = ['personal', 'motivation', 'inspiration', 'growth', 'mindset']
-    education_keywords = ['education', 'learn', 'tutorial', 'guide', 'course', 'training']
-    
-    for response in responses:
-        response_clean = clean_text(response).lower()
-        if not response_clean:
-            continue
-        
-        # Add sentiment analysis
-        sentiment = analyze_sentiment(response)
-        response_with_sentiment = {'text': response, 'sentiment': sentiment}
-            
-        categorized = False
-        
-        if any(keyword in response_clean for keyword in career_keywords):
-            categories['Career Tips & Opportunities'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in tech_keywords):
-            categories['Technical Skills & AI Content'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in trends_keywords):
-            categories['Industry Trends & Leadership'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in personal_keywords):
-            categories['Personal Development'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in education_keywords):
-            categories['Educational Resources'].append(response_with_sentiment)
-            categorized = True
-            
-        if not categorized:
-            categories['Other'].append(response_with_sentiment)
-    
-    return categories
-
-def categorize_interest_groups(responses):
-    """Categorize interest group preferences."""
-    categories = {
-        'Developer & Tech Groups': [],
-        'Data Science & Analytics': [],
-        'AI & Machine Learning': [],
-        'Business & Finance': [],
-        'Design & Creative': [],
-        'Other': []
-    }
-    
-    dev_keywords = ['developer', 'programming', 'coding', 'software', 'web', 'mobile', 'frontend', 'backend']
-    data_keywords = ['data', 'analytics', 'science', 'statistics', 'analysis']
-    ai_keywords = ['ai', 'artificial intelligence', 'machine learning', 'ml', 'deep learning']
-    business_keywords = ['business', 'finance', 'accounting', 'investment', 'marketing', 'sales']
-    design_keywords = ['design', 'ui', 'ux', 'creative', 'art', 'graphics']
-    
-    for response in responses:
-        response_clean = clean_text(response).lower()
-        if not response_clean:
-            continue
-        
-        # Add sentiment analysis
-        sentiment = analyze_sentiment(response)
-        response_with_sentiment = {'text': response, 'sentiment': sentiment}
-            
-        categorized = False
-        
-        if any(keyword in response_clean for keyword in dev_keywords):
-            categories['Developer & Tech Groups'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in data_keywords):
-            categories['Data Science & Analytics'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in ai_keywords):
-            categories['AI & Machine Learning'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in business_keywords):
-            categories['Business & Finance'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in design_keywords):
-            categories['Design & Creative'].append(response_with_sentiment)
-            categorized = True
-            
-        if not categorized:
-            categories['Other'].append(response_with_sentiment)
-    
-    return categories
-
-def categorize_suggestions(responses):
-    """Categorize suggestions and comments."""
-    categories = {
-        'Platform & Technical Improvements': [],
-        'Community Structure & Organization': [],
-        'Opportunities & Accessibility': [],
-        'Mentorship & Support': [],
-        'Content & Resources': [],
-        'Other': []
-    }
-    
-    platform_keywords = ['platform', 'app', 'website', 'technical', 'slow', 'bug', 'fix', 'improve', 'interface']
-    community_keywords = ['community', 'group', 'organize', 'structure', 'channel', 'discussion']
-    opportunity_keywords = ['opportunity', 'scholarship', 'job', 'access', 'available', 'fair', 'equal']
-    mentorship_keywords = ['mentor', 'support', 'help', 'guidance', 'coaching', 'advice']
-    content_keywords = ['content', 'resource', 'material', 'course', 'learning']
-    
-    for response in responses:
-        response_clean = clean_text(response).lower()
-        if not response_clean:
-            continue
-        
-        # Add sentiment analysis
-        sentiment = analyze_sentiment(response)
-        response_with_sentiment = {'text': response, 'sentiment': sentiment}
-            
-        categorized = False
-        
-        if any(keyword in response_clean for keyword in platform_keywords):
-            categories['Platform & Technical Improvements'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in community_keywords):
-            categories['Community Structure & Organization'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in opportunity_keywords):
-            categories['Opportunities & Accessibility'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in mentorship_keywords):
-            categories['Mentorship & Support'].append(response_with_sentiment)
-            categorized = True
-        elif any(keyword in response_clean for keyword in content_keywords):
-            categories['Content & Resources'].append(response_with_sentiment)
-            categorized = True
-            
-        if not categorized:
-            categories['Other'].append(response_with_sentiment)
-    
-    return categories
-
-def _require_column(df: pd.DataFrame, needle: str) -> str:
-    matches = [col for col in df.columns if needle in col]
-    if not matches:
-        raise ValueError(f"Required column containing '{needle}' not found. Available: {list(df.columns)}")
-    return matches[0]
-
-def _format_circle_ratings(series: pd.Series) -> Dict[str, int]:
-    counts = series.value_counts().sort_index()
-    formatted: Dict[str, int] = {}
-    for k, v in counts.items():
-        try:
-            key = f"{float(k):.1f}"
-        except Exception:
-            # If not numeric, keep as string
-            key = str(k)
-        formatted[key] = int(v)
-    return formatted
+# Ordered keyword tables for the categorize_* helpers; the first category whose
+# keywords appear in a response wins, anything unmatched goes to 'Other'.
+CATEGORY_KEYWORDS = {
+    'community_goals': [
+        ('Career Development & Job Opportunities', ['job', 'career', 'opportunity', 'employment', 'professional development', 'interview', 'resume', 'hire', 'position']),
+        ('Networking & Community Building', ['network', 'connect', 'community', 'friendship', 'relationship', 'collaborate', 'partnership']),
+        ('Skill Development & Learning', ['skill', 'learn', 'knowledge', 'education', 'training', 'course', 'expertise', 'development', 'upskill']),
+        ('Business & Entrepreneurship', ['business', 'startup', 'entrepreneur', 'fund', 'investment', 'scale', 'venture', 'cofounder']),
+        ('Mentorship & Guidance', ['mentor', 'guidance', 'advice', 'support', 'help', 'coaching']),
+    ],
+    'circle_feedback': [
+        ('Positive User Experience', ['love', 'great', 'good', 'easy', 'nice', 'excellent', 'wonderful', 'amazing', 'helpful', 'useful']),
+        ('Performance Issues', ['slow', 'load', 'lag', 'freeze', 'crash', 'speed', 'fast', 'performance']),
+        ('Content Organization', ['content', 'post', 'organize', 'structure', 'format', 'layout']),
+        ('Navigation & Usability', ['navigate', 'find', 'search', 'menu', 'interface', 'design', 'user experience']),
+        ('Feature Requests', ['feature', 'add', 'need', 'want', 'suggest', 'improve', 'enhancement']),
+    ],
+    'content_preferences': [
+        ('Career Tips & Opportunities', ['career', 'job', 'opportunity', 'interview', 'resume', 'professional']),
+        ('Technical Skills & AI Content', ['ai', 'tech', 'coding', 'programming', 'development', 'software', 'web3', 'data', 'analytics']),
+        ('Industry Trends & Leadership', ['trend', 'industry', 'leader', 'leadership', 'business', 'innovation']),
+        ('Personal Development', ['personal', 'motivation', 'inspiration', 'growth', 'mindset']),
+        ('Educational Resources', ['education', 'learn', 'tutorial', 'guide', 'course', 'training']),
+    ],
+    'interest_groups': [
+        ('Developer & Tech Groups', ['developer', 'programming', 'coding', 'software', 'web', 'mobile', 'frontend', 'backend']),
+        ('Data Science & Analytics', ['data', 'analytics', 'science', 'statistics', 'analysis']),
+        ('AI & Machine Learning', ['ai', 'artificial intelligence', 'machine learning', 'ml', 'deep learning']),
+        ('Business & Finance', ['business', 'finance', 'accounting', 'investment', 'marketing', 'sales']),
+        ('Design & Creative', ['design', 'ui', 'ux', 'creative', 'art', 'graphics']),
+    ],
+    'suggestions': [
+        ('Platform & Technical Improvements', ['platform', 'app', 'website', 'technical', 'slow', 'bug', 'fix', 'improve', 'interface']),
+        ('Community Structure & Organization', ['community', 'group', 'organize', 'structure', 'channel', 'discussion']),
+        ('Opportunities & Accessibility', ['opportunity', 'scholarship', 'job', 'access', 'available', 'fair', 'equal']),
+        ('Mentorship & Support', ['mentor', 'support', 'help', 'guidance', 'coaching', 'advice']),
+        ('Content & Resources', ['content', 'resource', 'material', 'course', 'learning']),
+    ],
+}
+
+def _compile_keywords(keywords: List[str]) -> re.Pattern:
+    """Compile keywords into one alternation; matches anywhere, like a substring test."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+_CATEGORY_PATTERNS = {
+    table: [(name, _compile_keywords(keywords)) for name, keywords in rules]
+    for table, rules in CATEGORY_KEYWORDS.items()
+}
+
+# Shortest keyword per table, so texts that cannot match any category go straight
+# to 'Other' without a scan
+_CATEGORY_MIN_LEN = {
+    table: min(len(keyword) for _, keywords in rules for keyword in keywords)
+    for table, rules in CATEGORY_KEYWORDS.items()
+}
+
+def _build_automaton(rules):
+    """One Aho-Corasick automaton over a table's keywords, valued by category rank."""
+    automaton = ahocorasick.Automaton()
+    for rank, (_, keywords) in enumerate(rules):
+        for keyword in keywords:
+            if not automaton.exists(keyword):  # a keyword belongs to its first category
+                automaton.add_word(keyword, rank)
+    automaton.make_automaton()
+    return automaton
+
+_CATEGORY_AUTOMATA = (
+    {table: _build_automaton(rules) for table, rules in CATEGORY_KEYWORDS.items()}
+    if ahocorasick is not None else {}
+)
+
+def _match_category(table: str, text: str) -> str:
+    """Return the first category in ``table`` with a keyword in text, else 'Other'.
+
+    Requires the table's Aho-Corasick automaton; _label_texts covers the case without it.
+    """
+    if len(text) < _CATEGORY_MIN_LEN[table]:
+        return 'Other'
+    # Hits arrive in text order, so take the best-ranked category among all of them
+    rank = min((rank for _, rank in _CATEGORY_AUTOMATA[table].iter(text)), default=None)
+    return CATEGORY_KEYWORDS[table][rank][0] if rank is not None else 'Other'
+
+def _label_texts(table: str, texts: pd.Series) -> np.ndarray:
+    """First matching category in ``table`` (else 'Other') for each of a Series of cleaned texts."""
+    if table in _CATEGORY_AUTOMATA:
+        return np.array([_match_category(table, text) for text in texts], dtype=object)
+    # Without the automaton, scan column-wise: each category only searches the texts
+    # no earlier category claimed, which keeps first-match priority
+    labels = np.full(len(texts), 'Other', dtype=object)
+    remaining = pd.Series(texts.to_numpy(dtype=object))
+    for category, pattern in _CATEGORY_PATTERNS[table]:
+        hit = remaining.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+        labels[remaining.index[hit]] = category
+        remaining = remaining[~hit]
+    return labels
+
+def _lowercase_column(responses: pd.Series) -> pd.Series:
+    """Lowercased text of a response column's non-missing values, aligned with ``responses.dropna()``."""
+    return responses.dropna().astype(str).astype(object).str.lower()
+
+def _sentiment_series(lowered: pd.Series) -> pd.Series:
+    """analyze_sentiment over a lowercased response column, scoring each distinct answer once."""
+    scores = {text: _lowered_sentiment(text) if text else 'neutral' for text in lowered.unique()}
+    return lowered.map(scores)
+
+def _categorize_column(table: str, responses: pd.Series, lowered: pd.Series = None) -> pd.DataFrame:
+    """Label a raw response column by ``table`` as a text/sentiment/category frame.
+
+    Empty responses are dropped; ``category`` is a Categorical over the table's
+    categories plus 'Other', in table order.
+    """
+    names = [category for category, _ in CATEGORY_KEYWORDS[table]] + ['Other']
+    responses = responses.dropna()
+    if lowered is None:
+        lowered = _lowercase_column(responses)
+    cleaned = lowered.str.strip()
+    keep = (cleaned != '').to_numpy(dtype=bool)
+    responses, lowered, cleaned = responses[keep], lowered[keep], cleaned[keep]
+    # Answers repeat across respondents, so label each distinct text once and broadcast
+    distinct = pd.Series(cleaned.unique(), dtype=object)
+    labels = dict(zip(distinct, _label_texts(table, distinct)))
+    return pd.DataFrame({
+        'text': responses.to_numpy(dtype=object),
+        'sentiment': _sentiment_series(lowered).to_numpy(dtype=object),
+        'category': pd.Categorical(cleaned.map(labels).to_numpy(dtype=object), categories=names),
+    })
+
+def _records_by_category(frame: pd.DataFrame) -> Dict[str, List[Dict[str, Any]]]:
+    """Expand a _categorize_column frame to {category: [{'text', 'sentiment'}, ...]}."""
+    records = {category: [] for category in frame['category'].cat.categories}
+    # Bucket row by row rather than groupby on the Categorical, which is slow per group
+    for text, sentiment, category in zip(frame['text'].tolist(), frame['sentiment'].tolist(),
+                                         frame['category'].tolist()):
+        records[category].append({'text': text, 'sentiment': sentiment})
+    return records
+
+# Multi-select event/contribution answers: a response counts towards every label
+# whose keywords it mentions.
+EVENT_KEYWORDS = [
+    ('Skill-building Workshops', ['skill', 'workshop']),
+    ('Career Development', ['career', 'networking']),
+    ('Expert Q&A', ['q&a', 'expert']),
+    ('Local Meetups', ['meetup', 'local']),
+    ('Social Hangouts', ['social', 'hangout']),
+    ('Presentations', ['presentation', 'showcase']),
+]
+
+CONTRIBUTION_KEYWORDS = [
+    ('Content Sharing', ['content', 'sharing', 'article']),
+    ('Mentoring', ['mentor']),
+    ('Event Hosting', ['host', 'event']),
+    ('Moderating', ['moderat']),
+    ('Not Ready Yet', ['not ready', 'attend']),
+]
+
+def _mention_scanner(table):
+    """Labels of a mention table, one compiled scan over all its keywords, and each keyword's label indices."""
+    term_labels = defaultdict(list)
+    for k, (_, keywords) in enumerate(table):
+        for keyword in keywords:
+            term_labels[keyword].append(k)
+    return [label for label, _ in table], _compile_terms(list(term_labels)), dict(term_labels)
+
+_EVENT_SCANNER = _mention_scanner(EVENT_KEYWORDS)
+_CONTRIBUTION_SCANNER = _mention_scanner(CONTRIBUTION_KEYWORDS)
+
+def _count_mentions(lowered: pd.Series, scanner) -> Dict[str, int]:
+    """Count lowercased responses mentioning each label, keyed in order of first mention like a Counter."""
+    if lowered.empty:
+        return {}
+    labels, terms, term_labels = scanner
+    # Multi-select answers repeat a lot: scan each distinct answer once for all keywords
+    codes, distinct = pd.factorize(lowered)
+    hits = np.zeros((len(distinct), len(labels)), dtype=bool)
+    for row, text in enumerate(distinct):
+        for term in _find_terms(terms, text):
+            hits[row, term_labels[term]] = True
+    # One boolean column per label; all counts and first mentions come from whole-matrix reductions
+    mentions = hits[codes]
+    counts = mentions.sum(axis=0)
+    first = mentions.argmax(axis=0)
+    # Stable sort keeps table order for labels first mentioned by the same response
+    order = np.argsort(first, kind='stable')
+    return {labels[k]: int(counts[k]) for k in order if counts[k]}
+
+def categorize_community_goals(responses: pd.Series, lowered: pd.Series = None):
+    """Categorize responses about what members hope to gain (a raw response column, optionally with its _lowercase_column)."""
+    return _categorize_column('community_goals', responses, lowered)
+
+def categorize_circle_feedback(responses: pd.Series, lowered: pd.Series = None):
+    """Categorize Circle platform feedback (a raw response column, optionally with its _lowercase_column)."""
+    return _categorize_column('circle_feedback', responses, lowered)
+
+def categorize_content_preferences(responses: pd.Series, lowered: pd.Series = None):
+    """Categorize what kind of content members want (a raw response column, optionally with its _lowercase_column)."""
+    return _categorize_column('content_preferences', responses, lowered)
+
+def categorize_interest_groups(responses: pd.Series, lowered: pd.Series = None):
+    """Categorize interest group preferences (a raw response column, optionally with its _lowercase_column)."""
+    return _categorize_column('interest_groups', responses, lowered)
+
+def categorize_suggestions(responses: pd.Series, lowered: pd.Series = None):
+    """Categorize suggestions and comments (a raw response column, optionally with its _lowercase_column)."""
+    return _categorize_column('suggestions', responses, lowered)
+
+# Substrings of the question headers process_survey_data reads, in unpacking order
+REQUIRED_COLUMNS = [
+    'What country are you based in',
+    'What is your preferred way to receive updates',
+    'How would you rate you experience of Circle',
+    'Please share your reasoning behind your rating for Circle',
+    'What are the top 1-3 things you hope to gain',
+    'To help us plan, what types of events',
+    'What kind of content / articles / resources',
+    'If we were to create interest-based groups',
+    'How would you be interested in contributing',
+    'Would you like us to inform you with specific ways',
+    'Do you have any other comments, questions or suggestion',
+]
+
+# Community-aspect rating questions; each is optional in the export
+VALUE_COLUMNS = [
+    'How valuable do you find the following aspects of the ALX community? [Online Events (e.g., webinars, workshops)]',
+    'How valuable do you find the following aspects of the ALX community? [In-person Events (e.g., meetups, networking sessions)]',
+    'How valuable do you find the following aspects of the ALX community? [The community platform (Circle)]',
+    'How valuable do you find the following aspects of the ALX community? [Networking opportunities with other members]',
+    'How valuable do you find the following aspects of the ALX community? [Content and resources shared with community]',
+]
+
+def _is_used_column(name: str) -> bool:
+    """read_csv usecols filter: keep only the columns the report and deduplication read."""
+    name = name.strip()
+    lowered = name.lower()
+    return (any(needle in name for needle in REQUIRED_COLUMNS) or name in VALUE_COLUMNS
+            or 'email' in lowered or 'timestamp' in lowered)
+
+def _resolve_columns(df: pd.DataFrame, needles: List[str]) -> Dict[str, str]:
+    """Map each needle to the first column containing it, in one pass over df.columns."""
+    columns = df.columns.tolist()
+    found: Dict[str, str] = {}
+    unresolved = list(needles)
+    for col in columns:
+        for needle in [n for n in unresolved if n in col]:
+            found[needle] = col
+            unresolved.remove(needle)
+        if not unresolved:
+            break
+    if unresolved:
+        raise ValueError(f"Required column containing '{unresolved[0]}' not found. Available: {columns}")
+    return {needle: found[needle] for needle in needles}
+
+def _value_counts_dict(series: pd.Series) -> Dict[Any, int]:
+    """Equivalent of series.value_counts().to_dict(), counted on factorized codes."""
+    codes, uniques = pd.factorize(series)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    # Stable sort keeps first-appearance order among equal counts, as value_counts does
+    order = np.argsort(-counts, kind='stable')
+    return dict(zip(np.asarray(uniques, dtype=object)[order].tolist(), counts[order].tolist()))
+
+def _format_circle_ratings(series: pd.Series) -> Tuple[Dict[str, int], float]:
+    """Histogram of Circle ratings keyed '1.0'..'5.0' in ascending order, plus their mean (0 if none)."""
+    ratings = pd.to_numeric(series, errors='coerce').dropna().astype(float)
+    mean = ratings.mean() if len(ratings) > 0 else 0
+    values = ratings.round(1).to_numpy()
+    # Ratings are small whole numbers, so bincount them; absent scores get no key
+    if values.size and values.min() >= 0 and values.max() <= 100 and (values == np.floor(values)).all():
+        counts = np.bincount(values.astype(np.int64))
+        return {f"{k:.1f}": int(v) for k, v in enumerate(counts) if v}, mean
+    # np.unique returns the distinct scores already sorted, with their counts
+    keys, counts = np.unique(values, return_counts=True)
+    return {f"{k:.1f}": int(v) for k, v in zip(keys.tolist(), counts.tolist())}, mean
 
 def process_survey_data(csv_file_path, *, dedup: bool = True):
     """Main function to process the survey data."""
     print("Loading survey data...")
-    # Use proper CSV parsing with quote handling
-    df = pd.read_csv(csv_file_path, quotechar='"', skipinitialspace=True)
+    # Use proper CSV parsing with quote handling; skip the columns nothing reads
+    df = pd.read_csv(csv_file_path, quotechar='"', skipinitialspace=True, usecols=_is_used_column)
     
-    # Clean column names
-    df.columns = df.columns.str.strip()
+    # Clean column names; exports are usually already clean, so skip the rewrite then
+    stripped = df.columns.str.strip()
+    if not (df.columns == stripped).all():
+        df.columns = stripped
     
     # Deduplicate by email keeping latest timestamp when present (configurable)
     if dedup:
@@ -582,131 +719,88 @@ def process_survey_data(csv_file_path, *, dedup: bool = True):
     print(f"Columns: {list(df.columns)}")
     
     # Find actual column names (robust substring search)
-    country_col = _require_column(df, 'What country are you based in')
-    comm_pref_col = _require_column(df, 'What is your preferred way to receive updates')
-    circle_rating_col = _require_column(df, 'How would you rate you experience of Circle')
-    circle_feedback_col = _require_column(df, 'Please share your reasoning behind your rating for Circle')
-    goals_col = _require_column(df, 'What are the top 1-3 things you hope to gain')
-    events_col = _require_column(df, 'To help us plan, what types of events')
-    content_col = _require_column(df, 'What kind of content / articles / resources')
-    interest_col = _require_column(df, 'If we were to create interest-based groups')
-    contribution_col = _require_column(df, 'How would you be interested in contributing')
-    involve_col = _require_column(df, 'Would you like us to inform you with specific ways')
-    suggestions_col = _require_column(df, 'Do you have any other comments, questions or suggestion')
+    (
+        country_col,
+        comm_pref_col,
+        circle_rating_col,
+        circle_feedback_col,
+        goals_col,
+        events_col,
+        content_col,
+        interest_col,
+        contribution_col,
+        involve_col,
+        suggestions_col,
+    ) = _resolve_columns(df, REQUIRED_COLUMNS).values()
     
     # Clean and normalize country names
     print("Cleaning country data...")
-    df[country_col] = df[country_col].apply(clean_country_name)
+    df[country_col] = clean_country_series(df[country_col])
     # Do NOT drop rows with missing country; include them in totals and bucket as 'Unknown' for country stats
     country_series_for_stats = df[country_col].replace('', 'Unknown')
     
     # Basic statistics
     # Coerce circle rating to numeric for consistency
     df[circle_rating_col] = pd.to_numeric(df[circle_rating_col], errors='coerce')
-    stats = {
-        'total_responses': len(df),
-        'countries': country_series_for_stats.value_counts().to_dict(),
-        'communication_preferences': df[comm_pref_col].value_counts().to_dict(),
-        'circle_ratings': _format_circle_ratings(df[circle_rating_col].dropna())
-    }
+    circle_ratings, avg_circle_rating = _format_circle_ratings(df[circle_rating_col].dropna())
+    countries = _value_counts_dict(country_series_for_stats)
+    communication_preferences = _value_counts_dict(df[comm_pref_col])
     
     # Process value ratings for community aspects
-    value_columns = [
-        'How valuable do you find the following aspects of the ALX community? [Online Events (e.g., webinars, workshops)]',
-        'How valuable do you find the following aspects of the ALX community? [In-person Events (e.g., meetups, networking sessions)]',
-        'How valuable do you find the following aspects of the ALX community? [The community platform (Circle)]',
-        'How valuable do you find the following aspects of the ALX community? [Networking opportunities with other members]',
-        'How valuable do you find the following aspects of the ALX community? [Content and resources shared with community]'
-    ]
-    
+    # Count all aspects in one groupby over the long form; sort=False keeps first
+    # appearance so the stable sort below reproduces value_counts' key order
+    present = [col for col in VALUE_COLUMNS if col in df.columns]
+    long = df[present].melt(var_name='aspect', value_name='rating').dropna()
+    counts = long.groupby(['aspect', 'rating'], sort=False).size()
+    counted = set(counts.index.get_level_values('aspect'))
     value_ratings = {}
-    for col in value_columns:
-        if col in df.columns:
-            short_name = col.split('[')[1].split(']')[0]
-            value_ratings[short_name] = df[col].value_counts().to_dict()
+    for col in present:
+        short_name = col.split('[')[1].split(']')[0]
+        ratings = counts.loc[col] if col in counted else counts.iloc[:0]
+        value_ratings[short_name] = ratings.sort_values(ascending=False, kind='stable').to_dict()
     
     # Process text responses
+    # Lowercase each free-text column once; categorizers and mention counts share it
+    lowered = {col: _lowercase_column(df[col]) for col in (
+        goals_col, circle_feedback_col, content_col, interest_col, suggestions_col, events_col, contribution_col)}
     print("Categorizing text responses...")
     
     # Community goals
-    goals_responses = df[goals_col].dropna().tolist()
-    categorized_goals = categorize_community_goals(goals_responses)
+    categorized_goals = categorize_community_goals(df[goals_col], lowered[goals_col])
     
     # Circle feedback
-    circle_feedback = df[circle_feedback_col].dropna().tolist()
-    categorized_circle = categorize_circle_feedback(circle_feedback)
+    categorized_circle = categorize_circle_feedback(df[circle_feedback_col], lowered[circle_feedback_col])
     
     # Content preferences
-    content_responses = df[content_col].dropna().tolist()
-    categorized_content = categorize_content_preferences(content_responses)
+    categorized_content = categorize_content_preferences(df[content_col], lowered[content_col])
     
     # Interest groups
-    interest_responses = df[interest_col].dropna().tolist()
-    categorized_interests = categorize_interest_groups(interest_responses)
+    categorized_interests = categorize_interest_groups(df[interest_col], lowered[interest_col])
     
     # Suggestions
-    suggestions_responses = df[suggestions_col].dropna().tolist()
-    categorized_suggestions = categorize_suggestions(suggestions_responses)
-    
-    # Event preferences
-    event_responses = df[events_col].dropna().tolist()
-    event_types = Counter()
-    for response in event_responses:
-        if pd.notna(response):
-            # Count mentions of different event types
-            response_lower = str(response).lower()
-            if 'skill' in response_lower or 'workshop' in response_lower:
-                event_types['Skill-building Workshops'] += 1
-            if 'career' in response_lower or 'networking' in response_lower:
-                event_types['Career Development'] += 1
-            if 'q&a' in response_lower or 'expert' in response_lower:
-                event_types['Expert Q&A'] += 1
-            if 'meetup' in response_lower or 'local' in response_lower:
-                event_types['Local Meetups'] += 1
-            if 'social' in response_lower or 'hangout' in response_lower:
-                event_types['Social Hangouts'] += 1
-            if 'presentation' in response_lower or 'showcase' in response_lower:
-                event_types['Presentations'] += 1
+    categorized_suggestions = categorize_suggestions(df[suggestions_col], lowered[suggestions_col])
     
-    # Contribution preferences
-    contribution_responses = df[contribution_col].dropna().tolist()
-    contribution_types = Counter()
-    for response in contribution_responses:
-        if pd.notna(response):
-            response_lower = str(response).lower()
-            if 'content' in response_lower or 'sharing' in response_lower or 'article' in response_lower:
-                contribution_types['Content Sharing'] += 1
-            if 'mentor' in response_lower:
-                contribution_types['Mentoring'] += 1
-            if 'host' in response_lower or 'event' in response_lower:
-                contribution_types['Event Hosting'] += 1
-            if 'moderat' in response_lower:
-                contribution_types['Moderating'] += 1
-            if 'not ready' in response_lower or 'attend' in response_lower:
-                contribution_types['Not Ready Yet'] += 1
-    
-    # Calculate average Circle rating
-    circle_ratings_numeric = df[circle_rating_col].dropna()
-    avg_circle_rating = circle_ratings_numeric.mean() if len(circle_ratings_numeric) > 0 else 0
+    # Event and contribution preferences
+    event_types = _count_mentions(lowered[events_col], _EVENT_SCANNER)
+    contribution_types = _count_mentions(lowered[contribution_col], _CONTRIBUTION_SCANNER)
     
     # Calculate contribution interest percentage
-    contribution_interest = df[involve_col].value_counts().to_dict()
-    contribution_percentage = (contribution_interest.get('Yes', 0) / len(df) * 100) if len(df) > 0 else 0
+    contribution_percentage = (int(df[involve_col].eq('Yes').sum()) / len(df) * 100) if len(df) > 0 else 0
     
     # Compile final data
     processed_data = {
         'stats': {
-            'total_responses': stats['total_responses'],
-            'countries_count': len(stats['countries']),  # Now showing actual clean country count
+            'total_responses': len(df),
+            'countries_count': len(countries),  # Now showing actual clean country count
             'avg_circle_rating': round(avg_circle_rating, 1),
             'contribution_percentage': round(contribution_percentage)
         },
-        'countries': stats['countries'],
-        'communication_preferences': stats['communication_preferences'],
-        'circle_ratings': stats['circle_ratings'],
+        'countries': countries,
+        'communication_preferences': communication_preferences,
+        'circle_ratings': circle_ratings,
         'value_ratings': value_ratings,
-        'event_preferences': dict(event_types),
-        'contribution_preferences': dict(contribution_types),
+        'event_preferences': event_types,
+        'contribution_preferences': contribution_types,
         'categorized_responses': {
             'community_goals': categorized_goals,
             'circle_feedback': categorized_circle,
@@ -718,12 +812,72 @@ def process_survey_data(csv_file_path, *, dedup: bool = True):
     
     return processed_data
 
-def write_js(data: Dict[str, Any], output_js_path: str = 'survey_data.js') -> None:
+def process_survey_data_cached(csv_file_path, *, dedup: bool = True, cache_dir: str = '.cache'):
+    """process_survey_data memoized on disk.
+
+    The cache key hashes the CSV's bytes together with this script's mtime and
+    size, the pandas and numpy versions and which optional accelerators are
+    installed, so a different input, script or environment misses the cache. An
+    unwritable cache directory only skips storing the result.
+    """
+    code_stat = os.stat(__file__)
+    key = hashlib.blake2b(digest_size=8)
+    with open(csv_file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            key.update(block)
+    accelerators = (rf_process is not None, ahocorasick is not None, orjson is not None)
+    key.update(f"{code_stat.st_mtime_ns}-{code_stat.st_size}-{pd.__version__}-{np.__version__}"
+               f"-{accelerators}-{dedup}".encode())
+    cache_path = os.path.join(cache_dir, key.hexdigest() + '.pkl')
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # missing or truncated cache entry; recompute below
+
+    data = process_survey_data(csv_file_path, dedup=dedup)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # A private temp name per run, so concurrent runs never write the same file
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix='.tmp', delete=False) as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, cache_path)
+    except OSError:
+        pass  # read-only or unwritable directory; the result is simply not cached
+    return data
+
+def to_json_ready(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of processed data with categorized response frames expanded to dicts."""
+    ready = dict(data)
+    ready['categorized_responses'] = {
+        section: _records_by_category(frame) for section, frame in data['categorized_responses'].items()
+    }
+    return ready
+
+def _json_bytes(data: Dict[str, Any], compact: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, byte-for-byte what json.dumps(ensure_ascii=False) writes.
+
+    2-space indented by default; ``compact`` drops all optional whitespace, which
+    roughly halves the file and the encoding time.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints wider than 64 bits, which only the stdlib encoder accepts
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def write_js(data: Dict[str, Any], output_js_path: str = 'survey_data.js', compact: bool = False) -> None:
     """Write processed data as a JS constant used by the dashboard."""
-    with open(output_js_path, 'w', encoding='utf-8') as f:
-        f.write('const surveyData = ')
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write(';' + "\n")
+    with open(output_js_path, 'wb') as f:
+        f.write(b'const surveyData = ')
+        f.write(_json_bytes(to_json_ready(data), compact=compact))
+        f.write(b';\n')
 
 if __name__ == "__main__":
     import argparse
@@ -732,17 +886,22 @@ if __name__ == "__main__":
     parser.add_argument('--out-json', default='survey_data.json', help='Path to output JSON file')
     parser.add_argument('--out-js', default='survey_data.js', help='Path to output JS file')
     parser.add_argument('--no-dedup', action='store_true', help='Do not deduplicate by email; include all rows in totals')
+    parser.add_argument('--cache', action='store_true', help='Reuse (and store) processed results in .cache/ for an unchanged CSV')
+    parser.add_argument('--compact', action='store_true', help='Write JSON/JS without indentation (smaller, faster to write)')
     args = parser.parse_args()
 
     try:
-        data = process_survey_data(args.csv, dedup=(not args.no_dedup))
+        if args.cache:
+            data = process_survey_data_cached(args.csv, dedup=(not args.no_dedup))
+        else:
+            data = process_survey_data(args.csv, dedup=(not args.no_dedup))
         
         # Save processed data as JSON
-        with open(args.out_json, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(args.out_json, 'wb') as f:
+            f.write(_json_bytes(to_json_ready(data), compact=args.compact))
         
         # Save as JS for the report
-        write_js(data, args.out_js)
+        write_js(data, args.out_js, compact=args.compact)
 
         print("\nProcessing complete!")
         print(f"Total responses processed: {data['stats']['total_responses']}")
@@ -0,0 +1,170 @@
+"""Behaviour checks for process_survey.py and process_city_survey.py.
+
+Every test runs against both scripts, each loaded twice: once with whatever
+optional accelerators (rapidfuzz, pyahocorasick, orjson) are installed, and once
+with them blocked so the pure-Python fallbacks are exercised.
+"""
+import importlib.util
+import pathlib
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+SCRIPTS = ('process_survey', 'process_city_survey')
+OPTIONAL_MODULES = ('rapidfuzz', 'ahocorasick', 'orjson')
+
+
+def _load_script(script: str, accelerated: bool):
+    """Import a script under a private name, optionally hiding the optional modules."""
+    with pytest.MonkeyPatch.context() as mp:
+        if not accelerated:
+            # A None entry in sys.modules makes the import raise ImportError
+            for name in OPTIONAL_MODULES:
+                mp.setitem(sys.modules, name, None)
+        spec = importlib.util.spec_from_file_location(
+            f"{script}_{'accelerated' if accelerated else 'fallback'}", ROOT / f'{script}.py')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module', params=[(script, accelerated) for script in SCRIPTS
+                                        for accelerated in (True, False)],
+                ids=lambda p: f"{p[0]}-{'accelerated' if p[1] else 'fallback'}")
+def survey(request):
+    script, accelerated = request.param
+    module = _load_script(script, accelerated)
+    if not accelerated:
+        assert module.rf_process is None and module.ahocorasick is None and module.orjson is None
+    return module
+
+
+@pytest.mark.parametrize('raw, expected', [
+    # accents, typographic apostrophes and case
+    ('Côte d’Ivoire', "Côte d'Ivoire"),
+    ('COTE DIVOIRE', "Côte d'Ivoire"),
+    ('São Tomé and Príncipe', 'Sao Tome and Principe'),
+    ('Egypt 🇪🇬', 'Egypt'),
+    ('  ghana  ', 'Ghana'),
+    # city, country answers
+    ('Lagos, Nigeria', 'Nigeria'),
+    ('Kigali, Rwanda', 'Rwanda'),
+    ('Cairo, Egypt', 'Egypt'),
+    # bare cities
+    ('Nairobi', 'Kenya'),
+    ('Accra', 'Ghana'),
+    ('Johannesburg', 'South Africa'),
+    ('Addis Ababa', 'Ethiopia'),
+    # aliases, abbreviations and typos
+    ('USA', 'United States'),
+    ('uk', 'United Kingdom'),
+    ('Kennya', 'Kenya'),
+    ('Nigerria', 'Nigeria'),
+    # longest country name wins
+    ('South Sudan', 'South Sudan'),
+    ('Sudan', 'Sudan'),
+    # answers that are not locations
+    ('me@gmail.com', ''),
+    ('Tourism and Hospitality', ''),
+    ('Career growth', ''),
+    ('', ''),
+    (None, ''),
+])
+def test_clean_country_name(survey, raw, expected):
+    assert survey.clean_country_name(raw) == expected
+
+
+def test_clean_country_series_matches_per_value_cleaning(survey):
+    locations = pd.Series(['Lagos, Nigeria', 'Nairobi', None, 'USA', 'Lagos, Nigeria', 'Côte d’Ivoire'])
+    expected = [survey.clean_country_name(value) for value in locations]
+    assert survey.clean_country_series(locations).tolist() == expected
+
+
+def _survey_frame(rows):
+    return pd.DataFrame(rows, columns=['Timestamp', 'Email Address', 'row'])
+
+
+def test_deduplicate_keeps_latest_timestamp_per_email(survey):
+    df = _survey_frame([
+        ('1/2/2024 10:00:00', 'a@x.com', 0),
+        ('3/4/2024 09:30:00', ' A@X.com ', 1),   # same email, later
+        ('2024-01-01 08:00', 'b@y.com', 2),
+        ('2023-12-31 23:59', 'b@y.com', 3),
+        ('1/2/2024 10:00:00', None, 4),          # no email: always kept
+    ])
+    result = survey.deduplicate_by_email(df)
+    assert list(result.columns) == list(df.columns)
+    assert result['row'].tolist() == [1, 2, 4]
+
+
+@pytest.mark.parametrize('timestamps, kept', [
+    (['garbage', '1/2/2024 10:00:00'], 1),   # a real timestamp beats an unparseable one
+    (['1/2/2024 10:00:00', None], 0),        # ... and a missing one
+    (['garbage', None], 1),                  # missing beats unparseable
+    ([None, 'garbage'], 0),
+    ([None, None], 0),                       # ties keep the first row
+    (['1/2/2024 10:00:00', '1/2/2024 10:00:00'], 0),
+])
+def test_deduplicate_timestamp_ordering(survey, timestamps, kept):
+    df = _survey_frame([(ts, 'a@x.com', i) for i, ts in enumerate(timestamps)])
+    assert survey.deduplicate_by_email(df)['row'].tolist() == [kept]
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('I love this community, very helpful', 'positive'),
+    ('Thanks!', 'positive'),
+    ('The platform is bad and slow', 'negative'),
+    ('It keeps crashing', 'negative'),
+    ('I cant find anything', 'negative'),
+    ('good but buggy and confusing', 'negative'),
+    ('Not helpful at all', 'neutral'),          # one positive term, one negative phrase
+    ('I would like more workshops', 'neutral'),
+    ('ok', 'neutral'),
+    ('', 'neutral'),
+    (None, 'neutral'),
+])
+def test_analyze_sentiment(survey, text, expected):
+    assert survey.analyze_sentiment(text) == expected
+
+
+def test_categorize_community_goals(survey):
+    responses = pd.Series(['Job opportunities and networking', 'I want to learn new skills',
+                           'Mentorship please', '', None, '  ', 'Career growth',
+                           'Something else entirely', 'JOB', 'Networking and learning',
+                           'startups', 'abc'])
+    records = survey.to_json_ready(
+        {'categorized_responses': {'goals': survey.categorize_community_goals(responses)}}
+    )['categorized_responses']['goals']
+    texts = {category: [record['text'] for record in items] for category, items in records.items()}
+    assert texts == {
+        # the first matching category wins, and keywords match case-insensitively anywhere
+        'Career Development & Job Opportunities': ['Job opportunities and networking', 'Career growth', 'JOB'],
+        'Networking & Community Building': ['Networking and learning'],
+        'Skill Development & Learning': ['I want to learn new skills'],
+        'Business & Entrepreneurship': ['startups'],
+        'Mentorship & Guidance': ['Mentorship please'],
+        'Other': ['Something else entirely', 'abc'],
+    }
+    assert all(record['sentiment'] == survey.analyze_sentiment(record['text'])
+               for items in records.values() for record in items)
+
+
+def test_categorize_circle_feedback_scores_sentiment(survey):
+    responses = pd.Series(['I love it, so easy to use', 'Too slow to load', 'Hard to find posts'])
+    records = survey.to_json_ready(
+        {'categorized_responses': {'circle': survey.categorize_circle_feedback(responses)}}
+    )['categorized_responses']['circle']
+    assert records['Positive User Experience'] == [{'text': 'I love it, so easy to use', 'sentiment': 'positive'}]
+    assert records['Performance Issues'] == [{'text': 'Too slow to load', 'sentiment': 'negative'}]
+    assert records['Content Organization'] == [{'text': 'Hard to find posts', 'sentiment': 'negative'}]
+
+
+def test_json_output_does_not_depend_on_orjson():
+    data = {'stats': {'total_responses': 3, 'avg_circle_rating': 4.2},
+            'countries': {"Côte d'Ivoire": 2, 'Kenya': 1}, 'circle_ratings': {'4.0': 2, '5.0': 1}}
+    for script in SCRIPTS:
+        accelerated, fallback = _load_script(script, True), _load_script(script, False)
+        for compact in (False, True):
+            assert accelerated._json_bytes(data, compact) == fallback._json_bytes(data, compact)